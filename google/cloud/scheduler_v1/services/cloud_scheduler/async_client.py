@@ -19,7 +19,11 @@ from collections import OrderedDict
 import functools
 import re
 from typing import Dict, Sequence, Tuple, Type, Union
-import pkg_resources
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # pragma: NO COVER
+    import importlib_metadata  # type: ignore
 
 import google.api_core.client_options as ClientOptions  # type: ignore
 from google.api_core import exceptions  # type: ignore
@@ -772,9 +776,9 @@ class CloudSchedulerAsyncClient:
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-scheduler",).version,
+        gapic_version=importlib_metadata.version("google-cloud-scheduler"),
     )
-except pkg_resources.DistributionNotFound:
+except importlib_metadata.PackageNotFoundError:
     _client_info = gapic_v1.client_info.ClientInfo()
 
 
@@ -19,7 +19,11 @@ from collections import OrderedDict
 import os
 import re
 from typing import Callable, Dict, Sequence, Tuple, Type, Union
-import pkg_resources
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # pragma: NO COVER
+    import importlib_metadata  # type: ignore
 
 import google.api_core.client_options as ClientOptions  # type: ignore
 from google.api_core import exceptions  # type: ignore
@@ -306,7 +310,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_jobs]
+        rpc = self._transport._wrapped_methods["list_jobs"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -386,7 +390,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_job]
+        rpc = self._transport._wrapped_methods["get_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -475,7 +479,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_job]
+        rpc = self._transport._wrapped_methods["create_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -574,7 +578,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_job]
+        rpc = self._transport._wrapped_methods["update_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -642,7 +646,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_job]
+        rpc = self._transport._wrapped_methods["delete_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -726,7 +730,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.pause_job]
+        rpc = self._transport._wrapped_methods["pause_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -810,7 +814,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.resume_job]
+        rpc = self._transport._wrapped_methods["resume_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -887,7 +891,7 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.run_job]
+        rpc = self._transport._wrapped_methods["run_job"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -904,9 +908,9 @@ class CloudSchedulerClient(metaclass=CloudSchedulerClientMeta):
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-scheduler",).version,
+        gapic_version=importlib_metadata.version("google-cloud-scheduler"),
     )
-except pkg_resources.DistributionNotFound:
+except importlib_metadata.PackageNotFoundError:
     _client_info = gapic_v1.client_info.ClientInfo()
 
 
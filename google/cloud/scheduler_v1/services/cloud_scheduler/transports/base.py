@@ -16,8 +16,12 @@
 #
 
 import abc
-import typing
-import pkg_resources
+from typing import TYPE_CHECKING
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # pragma: NO COVER
+    import importlib_metadata  # type: ignore
 
 from google import auth
 from google.api_core import exceptions  # type: ignore
@@ -30,14 +34,30 @@ from google.cloud.scheduler_v1.types import job
 from google.cloud.scheduler_v1.types import job as gcs_job
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
+# The annotations below are quoted, so that no generic aliases are built
+# when this module is imported; only type checkers need these names.
+if TYPE_CHECKING:  # pragma: NO COVER
+    from typing import Awaitable, Callable, Optional, Sequence, Union
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-scheduler",).version,
+        gapic_version=importlib_metadata.version("google-cloud-scheduler"),
     )
-except pkg_resources.DistributionNotFound:
+except importlib_metadata.PackageNotFoundError:
     _client_info = gapic_v1.client_info.ClientInfo()
 
+# Retry and timeout shared by the wrapped methods; a Retry is immutable, so
+# a single instance can back every RPC.
+_DEFAULT_RETRY = retries.Retry(
+    initial=0.1,
+    maximum=60.0,
+    multiplier=1.3,
+    predicate=retries.if_exception_type(
+        exceptions.ServiceUnavailable, exceptions.DeadlineExceeded,
+    ),
+)
+_DEFAULT_TIMEOUT = 600.0
+
 
 class CloudSchedulerTransport(abc.ABC):
     """Abstract transport class for CloudScheduler."""
@@ -49,9 +69,9 @@ class CloudSchedulerTransport(abc.ABC):
         *,
         host: str = "cloudscheduler.googleapis.com",
         credentials: credentials.Credentials = None,
-        credentials_file: typing.Optional[str] = None,
-        scopes: typing.Optional[typing.Sequence[str]] = AUTH_SCOPES,
-        quota_project_id: typing.Optional[str] = None,
+        credentials_file: "Optional[str]" = None,
+        scopes: "Optional[Sequence[str]]" = AUTH_SCOPES,
+        quota_project_id: "Optional[str]" = None,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -95,139 +115,100 @@ class CloudSchedulerTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
-        # Lifted into its own function so it can be stubbed out during tests.
-        self._prep_wrapped_messages()
-
     def _prep_wrapped_messages(self):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.list_jobs: gapic_v1.method.wrap_method(
+            "list_jobs": gapic_v1.method.wrap_method(
                 self.list_jobs,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        exceptions.ServiceUnavailable, exceptions.DeadlineExceeded,
-                    ),
-                ),
-                default_timeout=600.0,
+                default_retry=_DEFAULT_RETRY,
+                default_timeout=_DEFAULT_TIMEOUT,
                 client_info=_client_info,
             ),
-            self.get_job: gapic_v1.method.wrap_method(
+            "get_job": gapic_v1.method.wrap_method(
                 self.get_job,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        exceptions.ServiceUnavailable, exceptions.DeadlineExceeded,
-                    ),
-                ),
-                default_timeout=600.0,
+                default_retry=_DEFAULT_RETRY,
+                default_timeout=_DEFAULT_TIMEOUT,
                 client_info=_client_info,
             ),
-            self.create_job: gapic_v1.method.wrap_method(
-                self.create_job, default_timeout=600.0, client_info=_client_info,
+            "create_job": gapic_v1.method.wrap_method(
+                self.create_job,
+                default_timeout=_DEFAULT_TIMEOUT,
+                client_info=_client_info,
             ),
-            self.update_job: gapic_v1.method.wrap_method(
-                self.update_job, default_timeout=600.0, client_info=_client_info,
+            "update_job": gapic_v1.method.wrap_method(
+                self.update_job,
+                default_timeout=_DEFAULT_TIMEOUT,
+                client_info=_client_info,
             ),
-            self.delete_job: gapic_v1.method.wrap_method(
+            "delete_job": gapic_v1.method.wrap_method(
                 self.delete_job,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        exceptions.ServiceUnavailable, exceptions.DeadlineExceeded,
-                    ),
-                ),
-                default_timeout=600.0,
+                default_retry=_DEFAULT_RETRY,
+                default_timeout=_DEFAULT_TIMEOUT,
                 client_info=_client_info,
             ),
-            self.pause_job: gapic_v1.method.wrap_method(
-                self.pause_job, default_timeout=600.0, client_info=_client_info,
+            "pause_job": gapic_v1.method.wrap_method(
+                self.pause_job,
+                default_timeout=_DEFAULT_TIMEOUT,
+                client_info=_client_info,
             ),
-            self.resume_job: gapic_v1.method.wrap_method(
-                self.resume_job, default_timeout=600.0, client_info=_client_info,
+            "resume_job": gapic_v1.method.wrap_method(
+                self.resume_job,
+                default_timeout=_DEFAULT_TIMEOUT,
+                client_info=_client_info,
             ),
-            self.run_job: gapic_v1.method.wrap_method(
-                self.run_job, default_timeout=600.0, client_info=_client_info,
+            "run_job": gapic_v1.method.wrap_method(
+                self.run_job,
+                default_timeout=_DEFAULT_TIMEOUT,
+                client_info=_client_info,
             ),
         }
 
     @property
     def list_jobs(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.ListJobsRequest],
-        typing.Union[
-            cloudscheduler.ListJobsResponse,
-            typing.Awaitable[cloudscheduler.ListJobsResponse],
-        ],
-    ]:
+    ) -> "Callable[[cloudscheduler.ListJobsRequest], Union[cloudscheduler.ListJobsResponse, Awaitable[cloudscheduler.ListJobsResponse]]]":
         raise NotImplementedError()
 
     @property
     def get_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.GetJobRequest], typing.Union[job.Job, typing.Awaitable[job.Job]]
-    ]:
+    ) -> "Callable[[cloudscheduler.GetJobRequest], Union[job.Job, Awaitable[job.Job]]]":
         raise NotImplementedError()
 
     @property
     def create_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.CreateJobRequest],
-        typing.Union[gcs_job.Job, typing.Awaitable[gcs_job.Job]],
-    ]:
+    ) -> "Callable[[cloudscheduler.CreateJobRequest], Union[gcs_job.Job, Awaitable[gcs_job.Job]]]":
         raise NotImplementedError()
 
     @property
     def update_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.UpdateJobRequest],
-        typing.Union[gcs_job.Job, typing.Awaitable[gcs_job.Job]],
-    ]:
+    ) -> "Callable[[cloudscheduler.UpdateJobRequest], Union[gcs_job.Job, Awaitable[gcs_job.Job]]]":
         raise NotImplementedError()
 
     @property
     def delete_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.DeleteJobRequest],
-        typing.Union[empty.Empty, typing.Awaitable[empty.Empty]],
-    ]:
+    ) -> "Callable[[cloudscheduler.DeleteJobRequest], Union[empty.Empty, Awaitable[empty.Empty]]]":
         raise NotImplementedError()
 
     @property
     def pause_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.PauseJobRequest],
-        typing.Union[job.Job, typing.Awaitable[job.Job]],
-    ]:
+    ) -> "Callable[[cloudscheduler.PauseJobRequest], Union[job.Job, Awaitable[job.Job]]]":
         raise NotImplementedError()
 
     @property
     def resume_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.ResumeJobRequest],
-        typing.Union[job.Job, typing.Awaitable[job.Job]],
-    ]:
+    ) -> "Callable[[cloudscheduler.ResumeJobRequest], Union[job.Job, Awaitable[job.Job]]]":
         raise NotImplementedError()
 
     @property
     def run_job(
         self,
-    ) -> typing.Callable[
-        [cloudscheduler.RunJobRequest], typing.Union[job.Job, typing.Awaitable[job.Job]]
-    ]:
+    ) -> "Callable[[cloudscheduler.RunJobRequest], Union[job.Job, Awaitable[job.Job]]]":
         raise NotImplementedError()
 
 
@@ -145,6 +145,9 @@ class CloudSchedulerGrpcTransport(CloudSchedulerTransport):
             quota_project_id=quota_project_id,
         )
 
+        # Lifted into its own function so it can be stubbed out during tests.
+        self._prep_wrapped_messages()
+
     @classmethod
     def create_channel(
         cls,
@@ -15,14 +15,23 @@
 # limitations under the License.
 #
 
-from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple
+import asyncio
+import collections
+import functools
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
+from google.api_core import exceptions  # type: ignore
 from google.api_core import grpc_helpers_async  # type: ignore
 from google.auth import credentials  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
-from grpc.experimental import aio  # type: ignore
+
+try:
+    from grpc import aio  # type: ignore
+except ImportError:  # pragma: NO COVER
+    # grpcio < 1.32 only ships the AsyncIO API as an experimental module.
+    from grpc.experimental import aio  # type: ignore
 
 from google.cloud.scheduler_v1.types import cloudscheduler
 from google.cloud.scheduler_v1.types import job
@@ -33,6 +42,307 @@ from .base import CloudSchedulerTransport
 from .grpc import CloudSchedulerGrpcTransport
 
 
+@functools.lru_cache(maxsize=1)
+def _server_ssl_credentials() -> grpc.ChannelCredentials:
+    """Return SSL credentials which only authenticate the server.
+
+    Building them parses the system root certificates, so the result is
+    shared by every transport in the process.
+    """
+    return grpc.ssl_channel_credentials()
+
+
+def _default_ssl_credentials() -> grpc.ChannelCredentials:
+    """Return the application default SSL credentials.
+
+    Only credentials without a client certificate are cached: the default
+    client certificate, and whether to use one at all, may change over the
+    life of the process.
+    """
+    ssl_credentials = SslCredentials()
+    if ssl_credentials.is_mtls:
+        return ssl_credentials.ssl_credentials
+    return _server_ssl_credentials()
+
+
+def _serializer(message_cls) -> Callable[[Any], bytes]:
+    """Return a function serializing ``message_cls`` requests to bytes.
+
+    Like ``message_cls.serialize``, it accepts anything the message can be
+    built from, such as a ``dict`` or a protobuf message.
+    """
+    pb = message_cls.pb
+
+    def serialize(message) -> bytes:
+        return pb(message, coerce=True).SerializeToString()
+
+    return serialize
+
+
+def _deserializer(message_cls) -> Callable[[bytes], Any]:
+    """Return a function parsing a proto-plus ``message_cls`` from bytes.
+
+    The protobuf class is looked up once, instead of on every response.
+    """
+    pb_cls = message_cls.pb()
+    wrap = message_cls.wrap
+
+    def deserialize(payload: bytes):
+        return wrap(pb_cls.FromString(payload))
+
+    return deserialize
+
+
+class _StreamSemaphore:
+    """A first-in, first-out semaphore which can be acquired without awaiting.
+
+    Before Python 3.11, ``asyncio.Semaphore`` lets a new caller take a
+    released permit ahead of the queued ones, which can starve them under
+    sustained load. Here a released permit goes straight to the caller
+    which has waited longest.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters = collections.deque()
+
+    def acquire_nowait(self) -> bool:
+        """Take a permit if one is free right away; return whether it did."""
+        # Permits are handed to the waiters first, so a free one means
+        # that nobody is queued.
+        if not self._value:
+            return False
+        self._value -= 1
+        return True
+
+    async def acquire(self) -> None:
+        """Take a permit, waiting in line for one if none is free."""
+        if self.acquire_nowait():
+            return
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # A cancelled waiter is skipped by ``release``; pass on a
+            # permit handed over just before the cancellation.
+            if not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Give a permit back, to the longest waiting caller if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._value += 1
+
+
+class _QueuedCall(aio.UnaryUnaryCall):
+    """An RPC waiting for a free stream on a saturated channel.
+
+    A task issues the call once a stream is free; the wait counts against
+    the call's ``timeout``. The stub is looked up only then, so that a
+    channel replaced in the meantime is not used. Until the call is issued,
+    and if the wait fails, this object answers for it.
+    """
+
+    def __init__(self, pooled, idx: int, request, kwargs):
+        loop = asyncio.get_event_loop()
+        timeout = kwargs.get("timeout")
+        self._loop = loop
+        self._deadline = None if timeout is None else loop.time() + timeout
+        self._call = None
+        self._issued = loop.create_future()
+        self._task = loop.create_task(self._run(pooled, idx, request, kwargs))
+
+    async def _run(self, pooled, idx: int, request, kwargs):
+        try:
+            semaphore = await self._acquire(pooled._transport, idx)
+            try:
+                if self._deadline is not None:
+                    kwargs = dict(kwargs, timeout=self.time_remaining())
+                self._call = pooled._stubs[idx](request, **kwargs)
+            except BaseException:
+                semaphore.release()
+                raise
+            self._call.add_done_callback(lambda _: semaphore.release())
+        finally:
+            self._issued.set_result(None)
+        return await self._call
+
+    async def _acquire(self, transport, idx: int) -> _StreamSemaphore:
+        """Take a stream of the channel at ``idx`` before the deadline."""
+        while True:
+            semaphore = transport._stream_sems[idx]
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.time_remaining())
+            except asyncio.TimeoutError:
+                raise exceptions.DeadlineExceeded(
+                    "Deadline exceeded while waiting for a free stream."
+                ) from None
+            if transport._stream_sems[idx] is semaphore:
+                return semaphore
+            # The channel was replaced meanwhile; wait for its successor.
+            semaphore.release()
+
+    async def _issued_call(self):
+        """Return the gRPC call once issued, or ``None`` if the wait failed."""
+        if self._call is None:
+            await asyncio.wait(
+                (self._issued, self._task), return_when=asyncio.FIRST_COMPLETED
+            )
+        if self._call is None:
+            await asyncio.wait((self._task,))
+        return self._call
+
+    def __await__(self):
+        return self._task.__await__()
+
+    async def initial_metadata(self):
+        call = await self._issued_call()
+        return () if call is None else await call.initial_metadata()
+
+    async def trailing_metadata(self):
+        call = await self._issued_call()
+        return () if call is None else await call.trailing_metadata()
+
+    async def code(self) -> grpc.StatusCode:
+        call = await self._issued_call()
+        if call is not None:
+            return await call.code()
+        if self._task.cancelled():
+            return grpc.StatusCode.CANCELLED
+        if isinstance(self._task.exception(), exceptions.DeadlineExceeded):
+            return grpc.StatusCode.DEADLINE_EXCEEDED
+        return grpc.StatusCode.UNKNOWN
+
+    async def details(self) -> str:
+        call = await self._issued_call()
+        if call is not None:
+            return await call.details()
+        return "" if self._task.cancelled() else str(self._task.exception())
+
+    async def wait_for_connection(self) -> None:
+        call = await self._issued_call()
+        if call is None:
+            # Raise the reason the call was never issued.
+            await self._task
+        await call.wait_for_connection()
+
+    def cancelled(self) -> bool:
+        return self._task.cancelled()
+
+    def done(self) -> bool:
+        return self._task.done()
+
+    def time_remaining(self) -> Optional[float]:
+        if self._call is not None:
+            return self._call.time_remaining()
+        if self._deadline is None:
+            return None
+        return max(self._deadline - self._loop.time(), 0.0)
+
+    def cancel(self) -> bool:
+        if self._call is not None:
+            return self._call.cancel()
+        return self._task.cancel()
+
+    def add_done_callback(self, callback) -> None:
+        self._task.add_done_callback(lambda _: callback(self))
+
+
+class _PooledMultiCallable(aio.UnaryUnaryMultiCallable):
+    """Spread the calls of a single RPC across a pool of channels.
+
+    One ``unary_unary`` stub is built per channel of the pool; every
+    invocation picks the next channel in that pool's round-robin rotation
+    and waits for a free slot in that channel's stream limit. It is itself
+    a unary-unary multi-callable, so ``google.api_core`` wraps its errors
+    the same way as those of a plain stub.
+    """
+
+    def __init__(
+        self, transport, pool: str, stubs: Dict[int, aio.UnaryUnaryMultiCallable]
+    ):
+        self._transport = transport
+        self._pool = pool
+        self._stubs = stubs
+
+    def __call__(self, request, **kwargs):
+        # The stub and the semaphore share an index so that they always
+        # rotate together.
+        idx = self._transport._pick_channel(self._pool)
+        stub = self._stubs[idx]
+        semaphore = self._transport._stream_sems[idx]
+        if not semaphore.acquire_nowait():
+            # The channel is saturated: hand back a stand-in for the call.
+            return _QueuedCall(self, idx, request, kwargs)
+
+        # Otherwise return the gRPC call itself, so that awaiting the RPC
+        # does not go through an extra coroutine frame.
+        try:
+            call = stub(request, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        call.add_done_callback(lambda _: semaphore.release())
+        return call
+
+
+class _BufferedCalls:
+    """Accumulate RPCs and issue them as bounded concurrent waves.
+
+    Requests handed to :meth:`submit` are queued; once ``max_inflight``
+    of them are pending they are all sent at once and awaited together.
+    Leaving the ``async with`` block sends whatever is still queued.
+    The responses are collected, in submission order, in ``results``;
+    a failed RPC leaves its exception, mapped to a ``google.api_core``
+    exception like those of the client, in its place, so that one failure
+    does not discard the rest of its wave.
+    """
+
+    def __init__(self, transport, max_inflight: int):
+        self._transport = transport
+        self._max_inflight = max_inflight
+        self._pending = collections.deque()
+        self._stubs = {}
+        self.results = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # Do not send the queued requests if the block failed.
+        if exc_type is None:
+            await self.flush()
+
+    async def submit(self, method_name: str, request, **kwargs) -> None:
+        """Queue a call to the named RPC, sending the batch once it is full."""
+        if method_name not in self._transport._RPCS:
+            raise ValueError("Unknown RPC: {!r}".format(method_name))
+        stub = self._stubs.get(method_name)
+        if stub is None:
+            stub = self._stubs[method_name] = grpc_helpers_async.wrap_errors(
+                getattr(self._transport, method_name)
+            )
+        self._pending.append((stub, request, kwargs))
+        if len(self._pending) >= self._max_inflight:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send every queued request and wait for all of the responses."""
+        batch, self._pending = self._pending, collections.deque()
+        self.results.extend(
+            await asyncio.gather(
+                *(stub(req, **kwargs) for stub, req, kwargs in batch),
+                return_exceptions=True,
+            )
+        )
+
+
 class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
     """gRPC AsyncIO backend transport for CloudScheduler.
 
@@ -47,8 +357,101 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
     top of HTTP/2); the ``grpcio`` package must be installed.
     """
 
-    _grpc_channel: aio.Channel
-    _stubs: Dict[str, Callable] = {}
+    # The RPC callables are plain attributes built in ``__init__``; their
+    # slots shadow the abstract properties of the base transport.
+    __slots__ = (
+        "_grpc_channels",
+        "_channel_args",
+        "_next_channel_id",
+        "_pools",
+        "_rr",
+        "_max_concurrent_streams",
+        "_stream_sems",
+        "list_jobs",
+        "get_job",
+        "create_job",
+        "update_job",
+        "delete_job",
+        "pause_job",
+        "resume_job",
+        "run_job",
+    )
+
+    _grpc_channels: List[aio.Channel]
+    _stream_sems: List[_StreamSemaphore]
+    list_jobs: Callable[
+        [cloudscheduler.ListJobsRequest], Awaitable[cloudscheduler.ListJobsResponse]
+    ]
+    get_job: Callable[[cloudscheduler.GetJobRequest], Awaitable[job.Job]]
+    create_job: Callable[[cloudscheduler.CreateJobRequest], Awaitable[gcs_job.Job]]
+    update_job: Callable[[cloudscheduler.UpdateJobRequest], Awaitable[gcs_job.Job]]
+    delete_job: Callable[[cloudscheduler.DeleteJobRequest], Awaitable[empty.Empty]]
+    pause_job: Callable[[cloudscheduler.PauseJobRequest], Awaitable[job.Job]]
+    resume_job: Callable[[cloudscheduler.ResumeJobRequest], Awaitable[job.Job]]
+    run_job: Callable[[cloudscheduler.RunJobRequest], Awaitable[job.Job]]
+
+    # The path, request serializer and response deserializer of every RPC.
+    # They go straight to the underlying protobuf messages rather than
+    # through the proto-plus ``serialize`` and ``deserialize`` wrappers.
+    _RPCS = {
+        "list_jobs": (
+            "/google.cloud.scheduler.v1.CloudScheduler/ListJobs",
+            _serializer(cloudscheduler.ListJobsRequest),
+            _deserializer(cloudscheduler.ListJobsResponse),
+        ),
+        "get_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/GetJob",
+            _serializer(cloudscheduler.GetJobRequest),
+            _deserializer(job.Job),
+        ),
+        "create_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/CreateJob",
+            _serializer(cloudscheduler.CreateJobRequest),
+            _deserializer(gcs_job.Job),
+        ),
+        "update_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/UpdateJob",
+            _serializer(cloudscheduler.UpdateJobRequest),
+            _deserializer(gcs_job.Job),
+        ),
+        "delete_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/DeleteJob",
+            _serializer(cloudscheduler.DeleteJobRequest),
+            empty.Empty.FromString,
+        ),
+        "pause_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/PauseJob",
+            _serializer(cloudscheduler.PauseJobRequest),
+            _deserializer(job.Job),
+        ),
+        "resume_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/ResumeJob",
+            _serializer(cloudscheduler.ResumeJobRequest),
+            _deserializer(job.Job),
+        ),
+        "run_job": (
+            "/google.cloud.scheduler.v1.CloudScheduler/RunJob",
+            _serializer(cloudscheduler.RunJobRequest),
+            _deserializer(job.Job),
+        ),
+    }
+
+    # RPCs returning large payloads; they get a dedicated channel pool so
+    # they cannot delay the short request-response RPCs.
+    _BULK_METHODS = frozenset({"list_jobs"})
+
+    # Channel arguments applied unless the caller overrides them. Keepalive
+    # pings stop idle connections from being dropped by intermediaries,
+    # which would otherwise cost a new TLS handshake on the next RPC; the
+    # round robin policy connects to every resolved address up front
+    # instead of picking the first one lazily.
+    _DEFAULT_CHANNEL_OPTIONS = (
+        ("grpc.keepalive_time_ms", 60000),
+        ("grpc.keepalive_timeout_ms", 20000),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.lb_policy_name", "round_robin"),
+    )
 
     @classmethod
     def create_channel(
@@ -58,6 +461,8 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
         credentials_file: Optional[str] = None,
         scopes: Optional[Sequence[str]] = None,
         quota_project_id: Optional[str] = None,
+        max_receive_message_length: int = 32 << 20,
+        initial_window_size: int = 1 << 20,
         **kwargs,
     ) -> aio.Channel:
         """Create and return a gRPC AsyncIO channel object.
@@ -76,12 +481,24 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
                 are passed to :func:`google.auth.default`.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            max_receive_message_length (Optional[int]): The largest response,
+                in bytes, the channel accepts. Large ``list_jobs`` pages may
+                exceed gRPC's 4 MiB default.
+            initial_window_size (Optional[int]): The initial HTTP/2 flow
+                control window, in bytes; a larger window needs fewer
+                ``WINDOW_UPDATE`` round trips to receive a large response.
             kwargs (Optional[dict]): Keyword arguments, which are passed to the
-                channel creation.
+                channel creation. Any ``options`` are merged over the
+                default channel options.
         Returns:
             aio.Channel: A gRPC AsyncIO channel object.
         """
         scopes = scopes or cls.AUTH_SCOPES
+        options = dict(cls._DEFAULT_CHANNEL_OPTIONS)
+        options["grpc.max_receive_message_length"] = max_receive_message_length
+        options["grpc.http2.lookahead_bytes"] = initial_window_size
+        options.update(kwargs.pop("options", None) or ())
+        kwargs["options"] = list(options.items())
         return grpc_helpers_async.create_channel(
             host,
             credentials=credentials,
@@ -102,6 +519,9 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
         quota_project_id=None,
+        pool_size: int = 4,
+        bulk_pool_size: int = 1,
+        max_concurrent_streams: int = 100,
     ) -> None:
         """Instantiate the transport.
 
@@ -131,20 +551,35 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            pool_size (Optional[int]): The number of channels (and thus
+                HTTP/2 connections) to spread RPCs across. It is ignored
+                if ``channel`` is provided.
+            bulk_pool_size (Optional[int]): The number of additional
+                channels reserved for bulk RPCs such as ``list_jobs``. It
+                is ignored if ``channel`` is provided.
+            max_concurrent_streams (Optional[int]): The number of RPCs
+                allowed in flight on each channel. Further RPCs wait for a
+                slot here, instead of queueing invisibly inside gRPC once
+                the server's HTTP/2 stream limit (usually 100) is reached.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
               creation failed for any reason.
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
+            ValueError: If ``pool_size`` or ``bulk_pool_size`` is below 1.
         """
+        if not channel and min(pool_size, bulk_pool_size) < 1:
+            raise ValueError("pool_size and bulk_pool_size must be at least 1.")
+
+        # The host and arguments channels are created with; ``None`` when
+        # a channel is provided, as that one cannot be recreated.
+        self._channel_args = None
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
             credentials = False
-
-            # If a channel was explicitly provided, set it.
-            self._grpc_channel = channel
         elif api_mtls_endpoint:
             host = (
                 api_mtls_endpoint
@@ -160,18 +595,31 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
                     certificate_chain=cert, private_key=key
                 )
             else:
-                ssl_credentials = SslCredentials().ssl_credentials
+                ssl_credentials = _default_ssl_credentials()
 
-            # create a new channel. The provided one is ignored.
-            self._grpc_channel = type(self).create_channel(
+            # The mTLS channels are created once the base constructor ran.
+            self._channel_args = (
                 host,
-                credentials=credentials,
-                credentials_file=credentials_file,
-                ssl_credentials=ssl_credentials,
-                scopes=scopes or self.AUTH_SCOPES,
-                quota_project_id=quota_project_id,
+                {
+                    "credentials": credentials,
+                    "credentials_file": credentials_file,
+                    "ssl_credentials": ssl_credentials,
+                    "scopes": scopes or self.AUTH_SCOPES,
+                    "quota_project_id": quota_project_id,
+                },
             )
 
+        # Split the channels into a foreground pool and a bulk pool. A
+        # provided channel serves both.
+        if channel:
+            self._pools = {"foreground": (0,), "bulk": (0,)}
+        else:
+            self._pools = {
+                "foreground": tuple(range(pool_size)),
+                "bulk": tuple(range(pool_size, pool_size + bulk_pool_size)),
+            }
+        self._rr = dict.fromkeys(self._pools, 0)
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -181,264 +629,188 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
             quota_project_id=quota_project_id,
         )
 
-        self._stubs = {}
-
-    @property
-    def grpc_channel(self) -> aio.Channel:
-        """Create the channel designed to connect to this service.
-
-        This property caches on the instance; repeated calls return
-        the same channel.
-        """
-        # Sanity check: Only create a new channel if we do not already
-        # have one.
-        if not hasattr(self, "_grpc_channel"):
-            self._grpc_channel = self.create_channel(
-                self._host, credentials=self._credentials,
+        # Create the channels now that the host and credentials are
+        # resolved. If a channel was explicitly provided, it is the whole
+        # pool.
+        if channel:
+            self._grpc_channels = [channel]
+        else:
+            if self._channel_args is None:
+                self._channel_args = (self._host, {"credentials": self._credentials})
+            host, kwargs = self._channel_args
+            self._grpc_channels = type(self)._create_pool(
+                host, pool_size + bulk_pool_size, **kwargs
             )
+        self._next_channel_id = len(self._grpc_channels)
+        self._max_concurrent_streams = max_concurrent_streams
+        self._stream_sems = [
+            _StreamSemaphore(max_concurrent_streams) for _ in self._grpc_channels
+        ]
 
-        # Return the channel from cache.
-        return self._grpc_channel
+        # Build the stub of every RPC up front; gRPC handles serialization
+        # and deserialization, so we just need to pass in the functions
+        # for each.
+        for name in self._RPCS:
+            setattr(self, name, self._stub(name))
 
-    @property
-    def list_jobs(
-        self,
-    ) -> Callable[
-        [cloudscheduler.ListJobsRequest], Awaitable[cloudscheduler.ListJobsResponse]
-    ]:
-        r"""Return a callable for the list jobs method over gRPC.
-
-        Lists jobs.
+        # Lifted into its own function so it can be stubbed out during tests.
+        self._prep_wrapped_messages()
 
-        Returns:
-            Callable[[~.ListJobsRequest],
-                    Awaitable[~.ListJobsResponse]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "list_jobs" not in self._stubs:
-            self._stubs["list_jobs"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/ListJobs",
-                request_serializer=cloudscheduler.ListJobsRequest.serialize,
-                response_deserializer=cloudscheduler.ListJobsResponse.deserialize,
-            )
-        return self._stubs["list_jobs"]
+    @property
+    def grpc_channels(self) -> List[aio.Channel]:
+        """Return the pool of channels designed to connect to this service."""
+        return self._grpc_channels
 
     @property
-    def get_job(self) -> Callable[[cloudscheduler.GetJobRequest], Awaitable[job.Job]]:
-        r"""Return a callable for the get job method over gRPC.
+    def grpc_channel(self) -> aio.Channel:
+        """Return the first channel of the pool."""
+        return self._grpc_channels[0]
 
-        Gets a job.
+    async def warmup(self, timeout: Optional[float] = None) -> None:
+        """Connect every channel of the pool.
 
-        Returns:
-            Callable[[~.GetJobRequest],
-                    Awaitable[~.Job]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "get_job" not in self._stubs:
-            self._stubs["get_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/GetJob",
-                request_serializer=cloudscheduler.GetJobRequest.serialize,
-                response_deserializer=job.Job.deserialize,
-            )
-        return self._stubs["get_job"]
+        Channels connect lazily, so the first RPC on each of them would
+        otherwise pay for the TCP, TLS and HTTP/2 handshakes. Async
+        applications can await this during startup instead.
 
-    @property
-    def create_job(
-        self,
-    ) -> Callable[[cloudscheduler.CreateJobRequest], Awaitable[gcs_job.Job]]:
-        r"""Return a callable for the create job method over gRPC.
+        A channel keeps retrying to connect until it is ready, so without
+        a ``timeout`` this never returns if the service is unreachable.
 
-        Creates a job.
+        Args:
+            timeout (Optional[float]): How long to wait, in seconds, for
+                every channel to be ready. ``None`` waits indefinitely.
 
-        Returns:
-            Callable[[~.CreateJobRequest],
-                    Awaitable[~.Job]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If a channel is
+                not ready within ``timeout``.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "create_job" not in self._stubs:
-            self._stubs["create_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/CreateJob",
-                request_serializer=cloudscheduler.CreateJobRequest.serialize,
-                response_deserializer=gcs_job.Job.deserialize,
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(channel.channel_ready() for channel in self._grpc_channels)
+                ),
+                timeout,
             )
-        return self._stubs["create_job"]
+        except asyncio.TimeoutError:
+            raise exceptions.DeadlineExceeded(
+                "Deadline exceeded while connecting the channels."
+            ) from None
 
-    @property
-    def update_job(
-        self,
-    ) -> Callable[[cloudscheduler.UpdateJobRequest], Awaitable[gcs_job.Job]]:
-        r"""Return a callable for the update job method over gRPC.
-
-        Updates a job.
+    async def replace_channel(self, idx: int, grace: Optional[float] = 5.0) -> None:
+        """Swap a pooled channel for a freshly created one.
 
-        If successful, the updated [Job][google.cloud.scheduler.v1.Job]
-        is returned. If the job does not exist, ``NOT_FOUND`` is
-        returned.
+        This recovers from a stuck connection without rebuilding the whole
+        transport. RPCs issued once this is called use the new channel;
+        the old one is then closed, letting in-flight RPCs finish within
+        ``grace`` seconds.
 
-        If UpdateJob does not successfully return, it is possible for
-        the job to be in an
-        [Job.State.UPDATE_FAILED][google.cloud.scheduler.v1.Job.State.UPDATE_FAILED]
-        state. A job in this state may not be executed. If this happens,
-        retry the UpdateJob request until a successful response is
-        received.
+        Args:
+            idx (int): The index of the channel in :attr:`grpc_channels`;
+                negative indices count from the end.
+            grace (Optional[float]): How long to wait for in-flight RPCs on
+                the old channel before cancelling them. ``None`` waits
+                for all of them.
 
-        Returns:
-            Callable[[~.UpdateJobRequest],
-                    Awaitable[~.Job]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+        Raises:
+            ValueError: If the transport was given an explicit channel.
+            IndexError: If ``idx`` is out of range.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "update_job" not in self._stubs:
-            self._stubs["update_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/UpdateJob",
-                request_serializer=cloudscheduler.UpdateJobRequest.serialize,
-                response_deserializer=gcs_job.Job.deserialize,
-            )
-        return self._stubs["update_job"]
-
-    @property
-    def delete_job(
-        self,
-    ) -> Callable[[cloudscheduler.DeleteJobRequest], Awaitable[empty.Empty]]:
-        r"""Return a callable for the delete job method over gRPC.
+        if self._channel_args is None:
+            raise ValueError("A channel provided to the transport cannot be replaced.")
+        # Check the index before creating anything; the stubs are keyed by
+        # non-negative indices.
+        size = len(self._grpc_channels)
+        if not -size <= idx < size:
+            raise IndexError("Channel index out of range: {}".format(idx))
+        idx %= size
+
+        # A new channel id keeps gRPC from handing back the old connection.
+        host, kwargs = self._channel_args
+        new_channel = type(self).create_channel(
+            host, options=[("grpc.channel_id", self._next_channel_id)], **kwargs
+        )
+        self._next_channel_id += 1
 
-        Deletes a job.
+        old_channel = self._grpc_channels[idx]
+        self._grpc_channels[idx] = new_channel
+        # RPCs still running on the old channel release the old semaphore.
+        self._stream_sems[idx] = _StreamSemaphore(self._max_concurrent_streams)
+        for name in self._RPCS:
+            stubs = getattr(self, name)._stubs
+            if idx in stubs:
+                stubs[idx] = self._channel_stub(name, new_channel)
 
-        Returns:
-            Callable[[~.DeleteJobRequest],
-                    Awaitable[~.Empty]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "delete_job" not in self._stubs:
-            self._stubs["delete_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/DeleteJob",
-                request_serializer=cloudscheduler.DeleteJobRequest.serialize,
-                response_deserializer=empty.Empty.FromString,
-            )
-        return self._stubs["delete_job"]
+        await old_channel.close(grace)
 
-    @property
-    def pause_job(
-        self,
-    ) -> Callable[[cloudscheduler.PauseJobRequest], Awaitable[job.Job]]:
-        r"""Return a callable for the pause job method over gRPC.
-
-        Pauses a job.
-
-        If a job is paused then the system will stop executing the job
-        until it is re-enabled via
-        [ResumeJob][google.cloud.scheduler.v1.CloudScheduler.ResumeJob].
-        The state of the job is stored in
-        [state][google.cloud.scheduler.v1.Job.state]; if paused it will
-        be set to
-        [Job.State.PAUSED][google.cloud.scheduler.v1.Job.State.PAUSED].
-        A job must be in
-        [Job.State.ENABLED][google.cloud.scheduler.v1.Job.State.ENABLED]
-        to be paused.
+    @classmethod
+    def _create_pool(cls, host: str, size: int, **kwargs) -> List[aio.Channel]:
+        """Create ``size`` channels to the given host.
 
-        Returns:
-            Callable[[~.PauseJobRequest],
-                    Awaitable[~.Job]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+        Each channel gets a distinct channel argument so that gRPC does
+        not collapse them onto a single shared connection.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "pause_job" not in self._stubs:
-            self._stubs["pause_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/PauseJob",
-                request_serializer=cloudscheduler.PauseJobRequest.serialize,
-                response_deserializer=job.Job.deserialize,
-            )
-        return self._stubs["pause_job"]
+        return [
+            cls.create_channel(host, options=[("grpc.channel_id", i)], **kwargs)
+            for i in range(size)
+        ]
+
+    def _pick_channel(self, pool: str) -> int:
+        """Return the index of the next channel in the pool's rotation."""
+        # The transport is driven by a single event loop, so this
+        # read-modify-write cannot interleave and needs no lock.
+        count = self._rr[pool]
+        self._rr[pool] = (count + 1) & 0xFFFFFFFFFFFFFFFF
+        indices = self._pools[pool]
+        return indices[count % len(indices)]
+
+    def _stub(self, name: str) -> _PooledMultiCallable:
+        """Build one stub per channel of the named RPC's pool."""
+        pool = "bulk" if name in self._BULK_METHODS else "foreground"
+        channels = self._grpc_channels
+        return _PooledMultiCallable(
+            self,
+            pool,
+            {idx: self._channel_stub(name, channels[idx]) for idx in self._pools[pool]},
+        )
 
-    @property
-    def resume_job(
-        self,
-    ) -> Callable[[cloudscheduler.ResumeJobRequest], Awaitable[job.Job]]:
-        r"""Return a callable for the resume job method over gRPC.
+    def _channel_stub(
+        self, name: str, channel: aio.Channel
+    ) -> aio.UnaryUnaryMultiCallable:
+        """Build the stub of the named RPC on a single channel."""
+        path, request_serializer, response_deserializer = self._RPCS[name]
+        return channel.unary_unary(
+            path,
+            request_serializer=request_serializer,
+            response_deserializer=response_deserializer,
+        )
 
-        Resume a job.
+    def buffered(self, max_inflight: int = 64) -> _BufferedCalls:
+        """Batch many RPCs into concurrent waves.
 
-        This method reenables a job after it has been
-        [Job.State.PAUSED][google.cloud.scheduler.v1.Job.State.PAUSED].
-        The state of a job is stored in
-        [Job.state][google.cloud.scheduler.v1.Job.state]; after calling
-        this method it will be set to
-        [Job.State.ENABLED][google.cloud.scheduler.v1.Job.State.ENABLED].
-        A job must be in
-        [Job.State.PAUSED][google.cloud.scheduler.v1.Job.State.PAUSED]
-        to be resumed.
+        Use it as an async context manager instead of awaiting RPCs one
+        after the other in a loop:
 
-        Returns:
-            Callable[[~.ResumeJobRequest],
-                    Awaitable[~.Job]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "resume_job" not in self._stubs:
-            self._stubs["resume_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/ResumeJob",
-                request_serializer=cloudscheduler.ResumeJobRequest.serialize,
-                response_deserializer=job.Job.deserialize,
-            )
-        return self._stubs["resume_job"]
+        .. code-block:: python
 
-    @property
-    def run_job(self) -> Callable[[cloudscheduler.RunJobRequest], Awaitable[job.Job]]:
-        r"""Return a callable for the run job method over gRPC.
+            async with transport.buffered() as batch:
+                for request in requests:
+                    await batch.submit("create_job", request)
+            responses = batch.results
 
-        Forces a job to run now.
-        When this method is called, Cloud Scheduler will
-        dispatch the job, even if the job is already running.
+        The calls go straight to the transport's stubs, so they are not
+        retried and carry no default timeout. The exception of a failed
+        call, such as :class:`google.api_core.exceptions.NotFound`, is
+        stored in ``results`` instead of its response.
+
+        Args:
+            max_inflight (int): The number of requests sent per wave.
 
         Returns:
-            Callable[[~.RunJobRequest],
-                    Awaitable[~.Job]]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+            An async context manager whose ``submit`` coroutine queues a
+            request for the named RPC; it raises ``ValueError`` if the
+            transport has no such RPC.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "run_job" not in self._stubs:
-            self._stubs["run_job"] = self.grpc_channel.unary_unary(
-                "/google.cloud.scheduler.v1.CloudScheduler/RunJob",
-                request_serializer=cloudscheduler.RunJobRequest.serialize,
-                response_deserializer=job.Job.deserialize,
-            )
-        return self._stubs["run_job"]
+        return _BufferedCalls(self, max_inflight)
 
 
 __all__ = ("CloudSchedulerGrpcAsyncIOTransport",)
@@ -48,7 +48,7 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
     """
 
     _grpc_channel: aio.Channel
-    _stubs: Dict[str, Callable] = {}
+    _stubs: Dict[str, Callable]
 
     @classmethod
     def create_channel(
@@ -172,6 +172,10 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
                 quota_project_id=quota_project_id,
             )
 
+        # The base constructor wraps the stubs, so the stub cache must
+        # exist before it runs.
+        self._stubs = {}
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -181,8 +185,6 @@ class CloudSchedulerGrpcAsyncIOTransport(CloudSchedulerTransport):
             quota_project_id=quota_project_id,
         )
 
-        self._stubs = {}
-
     @property
     def grpc_channel(self) -> aio.Channel:
         """Create the channel designed to connect to this service.
@@ -31,6 +31,7 @@ dependencies = [
     "google-api-core[grpc] >= 1.22.0, < 2.0.0dev",
     "proto-plus >= 1.4.0",
     "libcst >= 0.2.5",
+    'importlib-metadata >= 1.0; python_version < "3.8"',
     'enum34; python_version < "3.4"',
 ]
 
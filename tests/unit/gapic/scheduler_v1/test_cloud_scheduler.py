@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import asyncio
 import os
 import mock
 
@@ -2384,13 +2385,25 @@ def test_cloud_scheduler_grpc_asyncio_transport_channel_mtls_with_client_cert_so
     grpc_ssl_channel_cred.assert_called_once_with(
         certificate_chain=b"cert bytes", private_key=b"key bytes"
     )
-    grpc_create_channel.assert_called_once_with(
-        "mtls.squid.clam.whelk:443",
-        credentials=mock_cred,
-        credentials_file=None,
-        scopes=("https://www.googleapis.com/auth/cloud-platform",),
-        ssl_credentials=mock_ssl_cred,
-        quota_project_id=None,
+    assert grpc_create_channel.call_count == 5
+    grpc_create_channel.assert_has_calls(
+        [
+            mock.call(
+                "mtls.squid.clam.whelk:443",
+                credentials=mock_cred,
+                credentials_file=None,
+                scopes=("https://www.googleapis.com/auth/cloud-platform",),
+                ssl_credentials=mock_ssl_cred,
+                quota_project_id=None,
+                options=[
+                    *transports.CloudSchedulerGrpcAsyncIOTransport._DEFAULT_CHANNEL_OPTIONS,
+                    ("grpc.max_receive_message_length", 32 << 20),
+                    ("grpc.http2.lookahead_bytes", 1 << 20),
+                    ("grpc.channel_id", i),
+                ],
+            )
+            for i in range(5)
+        ]
     )
     assert transport.grpc_channel == mock_grpc_channel
 
@@ -2449,6 +2462,7 @@ def test_cloud_scheduler_grpc_asyncio_transport_channel_mtls_with_adc(
     with mock.patch.multiple(
         "google.auth.transport.grpc.SslCredentials",
         __init__=mock.Mock(return_value=None),
+        is_mtls=mock.PropertyMock(return_value=True),
         ssl_credentials=mock.PropertyMock(return_value=mock_ssl_cred),
     ):
         mock_cred = mock.Mock()
@@ -2458,17 +2472,484 @@ def test_cloud_scheduler_grpc_asyncio_transport_channel_mtls_with_adc(
             api_mtls_endpoint=api_mtls_endpoint,
             client_cert_source=None,
         )
-        grpc_create_channel.assert_called_once_with(
-            "mtls.squid.clam.whelk:443",
-            credentials=mock_cred,
-            credentials_file=None,
-            scopes=("https://www.googleapis.com/auth/cloud-platform",),
-            ssl_credentials=mock_ssl_cred,
-            quota_project_id=None,
+        assert grpc_create_channel.call_count == 5
+        grpc_create_channel.assert_has_calls(
+            [
+                mock.call(
+                    "mtls.squid.clam.whelk:443",
+                    credentials=mock_cred,
+                    credentials_file=None,
+                    scopes=("https://www.googleapis.com/auth/cloud-platform",),
+                    ssl_credentials=mock_ssl_cred,
+                    quota_project_id=None,
+                    options=[
+                        *transports.CloudSchedulerGrpcAsyncIOTransport._DEFAULT_CHANNEL_OPTIONS,
+                        ("grpc.max_receive_message_length", 32 << 20),
+                        ("grpc.http2.lookahead_bytes", 1 << 20),
+                        ("grpc.channel_id", i),
+                    ],
+                )
+                for i in range(5)
+            ]
         )
         assert transport.grpc_channel == mock_grpc_channel
 
 
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_cloud_scheduler_grpc_asyncio_transport_channel_pool(grpc_create_channel):
+    channels = [mock.Mock() for _ in range(4)]
+    grpc_create_channel.side_effect = channels
+
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(), pool_size=3,
+    )
+    assert transport.grpc_channels == channels
+    assert transport.grpc_channel == channels[0]
+    for i, call in enumerate(grpc_create_channel.call_args_list):
+        assert ("grpc.channel_id", i) in call[1]["options"]
+
+    # Stubs are built up front: one per RPC for every foreground channel,
+    # while list calls only go to the bulk channel.
+    for channel in channels[:3]:
+        paths = [args[0] for args, _ in channel.unary_unary.call_args_list]
+        assert paths == [
+            "/google.cloud.scheduler.v1.CloudScheduler/GetJob",
+            "/google.cloud.scheduler.v1.CloudScheduler/CreateJob",
+            "/google.cloud.scheduler.v1.CloudScheduler/UpdateJob",
+            "/google.cloud.scheduler.v1.CloudScheduler/DeleteJob",
+            "/google.cloud.scheduler.v1.CloudScheduler/PauseJob",
+            "/google.cloud.scheduler.v1.CloudScheduler/ResumeJob",
+            "/google.cloud.scheduler.v1.CloudScheduler/RunJob",
+        ]
+    paths = [args[0] for args, _ in channels[3].unary_unary.call_args_list]
+    assert paths == ["/google.cloud.scheduler.v1.CloudScheduler/ListJobs"]
+
+    # Calls rotate across the channels of each pool.
+    assert [transport._pick_channel("foreground") for _ in range(4)] == [0, 1, 2, 0]
+    assert [transport._pick_channel("bulk") for _ in range(2)] == [3, 3]
+
+
+def test_cloud_scheduler_grpc_asyncio_transport_channel_pool_provided_channel():
+    channel = mock.Mock()
+
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(channel=channel)
+    assert transport.grpc_channels == [channel]
+    assert transport._pick_channel("foreground") == 0
+    assert transport._pick_channel("bulk") == 0
+
+
+@pytest.mark.parametrize("pool_size,bulk_pool_size", [(0, 1), (4, 0)])
+def test_cloud_scheduler_grpc_asyncio_transport_empty_pool(pool_size, bulk_pool_size):
+    with pytest.raises(ValueError):
+        transports.CloudSchedulerGrpcAsyncIOTransport(
+            credentials=credentials.AnonymousCredentials(),
+            pool_size=pool_size,
+            bulk_pool_size=bulk_pool_size,
+        )
+
+
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_cloud_scheduler_grpc_asyncio_create_channel_options(grpc_create_channel):
+    transports.CloudSchedulerGrpcAsyncIOTransport.create_channel(
+        "squid.clam.whelk",
+        options=[("grpc.keepalive_time_ms", 1000), ("grpc.primary_user_agent", "x")],
+    )
+    _, kwargs = grpc_create_channel.call_args
+    assert kwargs["options"] == [
+        ("grpc.keepalive_time_ms", 1000),
+        ("grpc.keepalive_timeout_ms", 20000),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.lb_policy_name", "round_robin"),
+        ("grpc.max_receive_message_length", 32 << 20),
+        ("grpc.http2.lookahead_bytes", 1 << 20),
+        ("grpc.primary_user_agent", "x"),
+    ]
+
+    transports.CloudSchedulerGrpcAsyncIOTransport.create_channel(
+        "squid.clam.whelk",
+        max_receive_message_length=1 << 30,
+        initial_window_size=1 << 16,
+    )
+    _, kwargs = grpc_create_channel.call_args
+    assert ("grpc.max_receive_message_length", 1 << 30) in kwargs["options"]
+    assert ("grpc.http2.lookahead_bytes", 1 << 16) in kwargs["options"]
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_buffered():
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(),
+    )
+    requests = [cloudscheduler.DeleteJobRequest(name=str(i)) for i in range(5)]
+
+    with mock.patch.object(type(transport.delete_job), "__call__") as call:
+        call.side_effect = lambda request, **kwargs: (
+            grpc_helpers_async.FakeUnaryUnaryCall(request.name)
+        )
+        async with transport.buffered(max_inflight=2) as batch:
+            for request in requests[:3]:
+                await batch.submit("delete_job", request, timeout=5)
+
+            # Full waves are sent as soon as they are queued.
+            assert call.call_count == 2
+            assert batch.results == ["0", "1"]
+
+            for request in requests[3:]:
+                await batch.submit("delete_job", request)
+
+        # The tail is sent when the block exits.
+        assert call.call_count == 5
+        assert batch.results == ["0", "1", "2", "3", "4"]
+        assert call.call_args_list[0] == mock.call(requests[0], timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_buffered_errors():
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    async with transport.buffered() as batch:
+        with pytest.raises(ValueError):
+            await batch.submit("warmup", cloudscheduler.GetJobRequest())
+
+    failed = asyncio.get_event_loop().create_future()
+    failed.set_exception(
+        aio.AioRpcError(
+            grpc.StatusCode.NOT_FOUND, aio.Metadata(), aio.Metadata(), "not found"
+        )
+    )
+    with mock.patch.object(type(transport.get_job), "__call__") as call:
+        call.side_effect = [
+            grpc_helpers_async.FakeUnaryUnaryCall(job.Job(name="a")),
+            failed,
+            grpc_helpers_async.FakeUnaryUnaryCall(job.Job(name="c")),
+        ]
+        async with transport.buffered() as batch:
+            for _ in range(3):
+                await batch.submit("get_job", cloudscheduler.GetJobRequest())
+
+    # A failed call does not discard the rest of its wave, and its error is
+    # mapped like those of the client.
+    assert batch.results[0] == job.Job(name="a")
+    assert isinstance(batch.results[1], exceptions.NotFound)
+    assert batch.results[1].message == "not found"
+    assert batch.results[2] == job.Job(name="c")
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_max_concurrent_streams():
+    channel = mock.Mock()
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        channel=channel, max_concurrent_streams=2,
+    )
+    responses = []
+
+    def call(request, **kwargs):
+        responses.append(asyncio.get_event_loop().create_future())
+        return responses[-1]
+
+    stub = channel.unary_unary.return_value
+    stub.side_effect = call
+
+    request = cloudscheduler.GetJobRequest()
+    calls = [transport.get_job(request) for _ in range(3)]
+
+    # While the channel has free streams, the gRPC call itself is returned.
+    assert calls[:2] == responses
+    # The third RPC waits for a stream instead of reaching the channel.
+    task = asyncio.ensure_future(calls[2])
+    await asyncio.sleep(0)
+    assert stub.call_count == 2
+
+    responses[0].set_result(job.Job(name="a"))
+    assert await calls[0] == job.Job(name="a")
+    # Let the freed stream wake the waiting RPC up.
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert stub.call_count == 3
+
+    for response in responses[1:]:
+        response.set_result(job.Job())
+    await asyncio.gather(calls[1], task)
+
+
+@pytest.mark.asyncio
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+async def test_cloud_scheduler_grpc_asyncio_transport_max_concurrent_streams_replaced(
+    grpc_create_channel,
+):
+    channels = [mock.Mock(close=mock.AsyncMock()) for _ in range(3)]
+    grpc_create_channel.side_effect = channels
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(),
+        pool_size=1,
+        max_concurrent_streams=1,
+    )
+    old_stub = channels[0].unary_unary.return_value
+    old_stub.return_value = asyncio.get_event_loop().create_future()
+    new_stub = channels[2].unary_unary.return_value
+    new_stub.return_value = asyncio.get_event_loop().create_future()
+    new_stub.return_value.set_result(job.Job())
+
+    request = cloudscheduler.GetJobRequest()
+    first = transport.get_job(request)
+    waiting = asyncio.ensure_future(transport.get_job(request, timeout=30))
+    await asyncio.sleep(0)
+
+    # Closing the old channel ends its RPC; the waiting one then goes to
+    # the new channel, with what is left of its timeout.
+    channels[0].close.side_effect = lambda grace: old_stub.return_value.cancel()
+    await transport.replace_channel(0)
+    assert await waiting == job.Job()
+    assert old_stub.call_count == 1
+    _, kwargs = new_stub.call_args
+    assert 0 < kwargs["timeout"] <= 30
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_max_concurrent_streams_timeout():
+    channel = mock.Mock()
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        channel=channel, max_concurrent_streams=1,
+    )
+    stub = channel.unary_unary.return_value
+    stub.return_value = asyncio.get_event_loop().create_future()
+
+    request = cloudscheduler.GetJobRequest()
+    transport.get_job(request)
+    # The wait for a free stream counts against the timeout.
+    with pytest.raises(exceptions.DeadlineExceeded):
+        await transport.get_job(request, timeout=0.01)
+    assert stub.call_count == 1
+    stub.return_value.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_max_concurrent_streams_fifo():
+    channel = mock.Mock()
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        channel=channel, max_concurrent_streams=1,
+    )
+    responses = []
+
+    def call(request, **kwargs):
+        responses.append(asyncio.get_event_loop().create_future())
+        return responses[-1]
+
+    stub = channel.unary_unary.return_value
+    stub.side_effect = call
+
+    first = transport.get_job(cloudscheduler.GetJobRequest(name="first"))
+    queued = transport.get_job(cloudscheduler.GetJobRequest(name="queued"))
+    await asyncio.sleep(0)
+
+    # A released stream goes to the queued RPC, not to a newer one.
+    responses[0].set_result(job.Job())
+    await first
+    late = transport.get_job(cloudscheduler.GetJobRequest(name="late"))
+    assert isinstance(late, type(queued))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    args, _ = stub.call_args
+    assert args[0].name == "queued"
+
+    late.cancel()
+    responses[1].set_result(job.Job())
+    await queued
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_queued_call():
+    channel = mock.Mock()
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        channel=channel, max_concurrent_streams=1,
+    )
+    stub = channel.unary_unary.return_value
+    stub.return_value = asyncio.get_event_loop().create_future()
+    request = cloudscheduler.GetJobRequest()
+    transport.get_job(request)
+
+    # A call waiting for a stream behaves like a gRPC call.
+    queued = transport.get_job(request, timeout=30)
+    assert isinstance(queued, aio.UnaryUnaryCall)
+    assert not queued.done()
+    assert 0 < queued.time_remaining() <= 30
+    callback = mock.Mock()
+    queued.add_done_callback(callback)
+
+    assert queued.cancel()
+    assert await queued.code() == grpc.StatusCode.CANCELLED
+    assert queued.done() and queued.cancelled()
+    callback.assert_called_once_with(queued)
+    assert stub.call_count == 1
+    stub.return_value.cancel()
+
+
+@pytest.mark.parametrize("is_mtls", [False, True])
+def test_cloud_scheduler_grpc_asyncio_default_ssl_credentials_cached(is_mtls):
+    transports.grpc_asyncio._server_ssl_credentials.cache_clear()
+    mock_ssl_cred = mock.Mock()
+    mock_server_cred = mock.Mock()
+    with mock.patch.multiple(
+        "google.auth.transport.grpc.SslCredentials",
+        __init__=mock.Mock(return_value=None),
+        is_mtls=mock.PropertyMock(return_value=is_mtls),
+        ssl_credentials=mock.PropertyMock(return_value=mock_ssl_cred),
+    ), mock.patch.object(
+        grpc, "ssl_channel_credentials", return_value=mock_server_cred
+    ) as ssl_channel_credentials:
+        expected = mock_ssl_cred if is_mtls else mock_server_cred
+        assert transports.grpc_asyncio._default_ssl_credentials() == expected
+        assert transports.grpc_asyncio._default_ssl_credentials() == expected
+
+        # Only the credentials without a client certificate are cached.
+        assert ssl_channel_credentials.call_count == (0 if is_mtls else 1)
+    transports.grpc_asyncio._server_ssl_credentials.cache_clear()
+
+
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_cloud_scheduler_grpc_asyncio_transport_stubs_built_once(grpc_create_channel):
+    grpc_create_channel.side_effect = lambda *args, **kwargs: mock.Mock()
+
+    for _ in range(2):
+        transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+            credentials=credentials.AnonymousCredentials(),
+        )
+        stub = transport.get_job
+
+        # Each stub is built once per channel and belongs to this transport.
+        for channel in transport.grpc_channels:
+            paths = [args[0] for args, _ in channel.unary_unary.call_args_list]
+            assert len(paths) == len(set(paths))
+        assert transport.get_job is stub
+
+
+@pytest.mark.asyncio
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+async def test_cloud_scheduler_grpc_asyncio_transport_warmup(grpc_create_channel):
+    grpc_create_channel.side_effect = lambda *args, **kwargs: mock.Mock(
+        channel_ready=mock.AsyncMock()
+    )
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(),
+    )
+
+    await transport.warmup()
+    for channel in transport.grpc_channels:
+        channel.channel_ready.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+async def test_cloud_scheduler_grpc_asyncio_transport_warmup_timeout(
+    grpc_create_channel,
+):
+    never_ready = asyncio.get_event_loop().create_future()
+
+    async def channel_ready():
+        await never_ready
+
+    channels = [mock.Mock(channel_ready=mock.AsyncMock()) for _ in range(2)]
+    channels[1].channel_ready.side_effect = channel_ready
+    grpc_create_channel.side_effect = channels
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(), pool_size=1,
+    )
+
+    # A channel which never becomes ready fails the warmup once it times out.
+    with pytest.raises(exceptions.DeadlineExceeded):
+        await transport.warmup(timeout=0.01)
+    assert never_ready.cancelled()
+
+
+def test_cloud_scheduler_grpc_asyncio_transport_serialization():
+    request = cloudscheduler.GetJobRequest(name="name_value")
+    serialize = transports.grpc_asyncio._serializer(cloudscheduler.GetJobRequest)
+    payload = cloudscheduler.GetJobRequest.serialize(request)
+    assert serialize(request) == payload
+    # Requests are coerced to the RPC's request type.
+    assert serialize({"name": "name_value"}) == payload
+    assert serialize(cloudscheduler.GetJobRequest.pb(request)) == payload
+    with pytest.raises(TypeError):
+        serialize(job.Job(name="name_value"))
+
+    response = job.Job(name="name_value", schedule="schedule_value")
+    deserialize = transports.grpc_asyncio._deserializer(job.Job)
+    result = deserialize(job.Job.serialize(response))
+    assert isinstance(result, job.Job)
+    assert result == response
+
+
+@pytest.mark.asyncio
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+async def test_cloud_scheduler_grpc_asyncio_transport_replace_channel(
+    grpc_create_channel,
+):
+    channels = [mock.Mock(close=mock.AsyncMock()) for _ in range(4)]
+    grpc_create_channel.side_effect = channels
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(), pool_size=2,
+    )
+    stub = transport.get_job
+    semaphores = list(transport._stream_sems)
+
+    await transport.replace_channel(1, grace=3)
+
+    # The new channel takes the old one's place and gets a fresh id.
+    assert transport.grpc_channels == [channels[0], channels[3], channels[2]]
+    _, kwargs = grpc_create_channel.call_args
+    assert ("grpc.channel_id", 3) in kwargs["options"]
+    assert kwargs["credentials"] == transport._credentials
+
+    # Only the stubs of the replaced channel are rebuilt, in place.
+    assert transport.get_job is stub
+    assert stub._stubs[0] == channels[0].unary_unary.return_value
+    assert stub._stubs[1] == channels[3].unary_unary.return_value
+    paths = [args[0] for args, _ in channels[3].unary_unary.call_args_list]
+    assert "/google.cloud.scheduler.v1.CloudScheduler/ListJobs" not in paths
+    assert "/google.cloud.scheduler.v1.CloudScheduler/GetJob" in paths
+
+    # The new channel starts with all of its streams free.
+    assert transport._stream_sems[0] is semaphores[0]
+    assert transport._stream_sems[1] is not semaphores[1]
+
+    channels[1].close.assert_awaited_once_with(3)
+
+
+@pytest.mark.asyncio
+async def test_cloud_scheduler_grpc_asyncio_transport_replace_provided_channel():
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(channel=mock.Mock())
+
+    with pytest.raises(ValueError):
+        await transport.replace_channel(0)
+
+
+@pytest.mark.asyncio
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+async def test_cloud_scheduler_grpc_asyncio_transport_replace_channel_index(
+    grpc_create_channel,
+):
+    channels = [mock.Mock(close=mock.AsyncMock()) for _ in range(4)]
+    grpc_create_channel.side_effect = channels
+    transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+        credentials=credentials.AnonymousCredentials(), pool_size=2,
+    )
+
+    # An out of range index fails before a channel is created.
+    with pytest.raises(IndexError):
+        await transport.replace_channel(3)
+    assert grpc_create_channel.call_count == 3
+
+    # A negative index also rebuilds the stubs of the channel it points to.
+    await transport.replace_channel(-1)
+    assert transport.grpc_channels == [channels[0], channels[1], channels[3]]
+    assert transport.list_jobs._stubs[2] == channels[3].unary_unary.return_value
+    channels[2].close.assert_awaited_once()
+
+
 def test_job_path():
     project = "squid"
     location = "clam"
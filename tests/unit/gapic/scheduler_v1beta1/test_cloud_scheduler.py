@@ -2471,6 +2471,24 @@ def test_cloud_scheduler_grpc_asyncio_transport_channel_mtls_with_adc(
         assert transport.grpc_channel == mock_grpc_channel
 
 
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_cloud_scheduler_grpc_asyncio_transport_stubs_built_once(grpc_create_channel):
+    grpc_create_channel.side_effect = lambda *args, **kwargs: mock.Mock()
+
+    for _ in range(2):
+        transport = transports.CloudSchedulerGrpcAsyncIOTransport(
+            credentials=credentials.AnonymousCredentials(),
+        )
+        stub = transport.get_job
+
+        # Each stub is built once and belongs to this transport's channel.
+        paths = [
+            args[0] for args, _ in transport.grpc_channel.unary_unary.call_args_list
+        ]
+        assert len(paths) == len(set(paths)) == 8
+        assert transport.get_job is stub
+
+
 def test_job_path():
     project = "squid"
     location = "clam"